@@ -6,11 +6,169 @@ Each component starts on a new page.
 """
 
 import PyPDF2
+import hashlib
+import io
+import json
+import os
 import re
+import shutil
+import subprocess
+import tempfile
+import threading
+from bisect import bisect_right
+from collections import Counter, deque
+from contextlib import closing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Pattern, Tuple
 from difflib import SequenceMatcher
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # fall back to difflib if rapidfuzz is missing
+    fuzz = None
+    process = None
+
+try:
+    import numpy as np
+except ImportError:  # rapidfuzz's batch scoring needs numpy; fall back to difflib
+    np = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; fall back to substring checks
+    ahocorasick = None
+
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # pypdfium2 is optional; fall back to PyPDF2
+    pdfium = None
+
+
+def _open_text_document(path):
+    """Open a PDF with the fastest available text-extraction backend."""
+    if pdfium is not None:
+        return pdfium.PdfDocument(path)
+    return PyPDF2.PdfReader(path)
+
+
+def _page_text(document, page_num: int) -> str:
+    """Extract text from a page of a document opened by _open_text_document."""
+    if pdfium is not None:
+        page = document[page_num]
+        textpage = page.get_textpage()
+        try:
+            return textpage.get_text_range()
+        finally:
+            textpage.close()
+            page.close()
+    return document.pages[page_num].extract_text()
+
+
+@lru_cache(maxsize=None)
+def _open_worker_document(path: str):
+    """Open a PDF once per worker process."""
+    return _open_text_document(path)
+
+
+def _extract_page_text(path: str, page_num: int) -> Optional[str]:
+    """Extract text from a page of a PDF, or None on failure (runs in a worker process)."""
+    try:
+        return _page_text(_open_worker_document(path), page_num)
+    except Exception as e:
+        print(f"Warning: Could not extract text from page {page_num}: {e}")
+        return None
+
+
+def _cached_ratio(matcher: SequenceMatcher, line_lower: str, component_lower: str,
+                  similarity_cache: Dict[Tuple[str, str], float]) -> float:
+    """
+    Return matcher.ratio() for a line, memoised by (line, component).
+    
+    Args:
+        matcher: SequenceMatcher with component_lower as seq2
+        line_lower: Lowercased, whitespace-normalised line of text
+        component_lower: Lowercased component name
+        similarity_cache: ratio() results keyed by (line, component)
+    
+    Returns:
+        Similarity score from 0 to 1
+    """
+    key = (line_lower, component_lower)
+    similarity = similarity_cache.get(key)
+    if similarity is None:
+        matcher.set_seq1(line_lower)
+        similarity = matcher.ratio()
+        similarity_cache[key] = similarity
+    return similarity
+
+
+def _scan_lines(lines_lower: List[str], components_lower: List[str],
+                matchers: List[SequenceMatcher], component_counts: List[Counter],
+                similarity_threshold: float,
+                similarity_cache: Dict[Tuple[str, str], float]) -> List[Tuple[int, int, float]]:
+    """
+    Fuzzy-match lines against component names with difflib.
+    
+    This is the matching kernel used when rapidfuzz is not installed. It only
+    touches its arguments, so it can be compiled ahead of time (e.g. with
+    Cython or mypyc) without changes to its callers.
+    
+    Args:
+        lines_lower: Lowercased, whitespace-normalised lines of text
+        components_lower: Lowercased component names
+        matchers: SequenceMatcher per component, with the component as seq2
+        component_counts: Character counts per component
+        similarity_threshold: Minimum similarity score (0-1) to consider a match
+        similarity_cache: ratio() results keyed by (line, component), shared
+            across calls so repeated lines (running headers, footers) are
+            only compared once
+    
+    Returns:
+        List of tuples (line_index, component_index, similarity) in line order
+    """
+    matches = []
+    found = set()
+    component_lens = [len(c) for c in components_lower]
+    
+    for line_idx, line_lower in enumerate(lines_lower):
+        line_len = len(line_lower)
+        line_counts = None
+        for comp_idx, comp_len in enumerate(component_lens):
+            if comp_idx in found:
+                continue
+            
+            # Cheap upper bounds on ratio() (as in real_quick_ratio and
+            # quick_ratio); skip the full comparison if either misses
+            total_len = line_len + comp_len
+            if 2.0 * min(line_len, comp_len) / total_len < similarity_threshold:
+                continue
+            if line_counts is None:
+                line_counts = Counter(line_lower)
+            common = sum((line_counts & component_counts[comp_idx]).values())
+            if 2.0 * common / total_len < similarity_threshold:
+                continue
+            
+            similarity = _cached_ratio(matchers[comp_idx], line_lower,
+                                       components_lower[comp_idx], similarity_cache)
+            if similarity >= similarity_threshold:
+                found.add(comp_idx)
+                matches.append((line_idx, comp_idx, similarity))
+                break  # Found a match for this line, move to next line
+    return matches
+
+
+# Section numbering before a header ("1.", "2.3", "iv.", "b)") and a page
+# number or dot leader after it ("page 3", "..... 12")
+_HEADER_NUMBERING_RE = re.compile(r'^(?:section\s+)?(?:\d+(?:\.\d+)*[.):]?|(?:[ivx]+|[a-z])[.)])\s+')
+_HEADER_PAGE_RE = re.compile(r'[\s.:\-\u2013\u2014]*(?:(?:page|p\.)\s*)?\d+$')
+
+# Font selection operator in a content stream, e.g. "/F1 16 Tf"
+_FONT_SIZE_RE = re.compile(rb'/[^\s/\[\]()<>{}%]+\s+(\d*\.?\d+)\s+Tf\b')
+
 
 class PDFSplitter:
     """Splits a PDF into separate PDFs based on section headers."""
@@ -27,27 +185,219 @@ class PDFSplitter:
         "Synergistic Activities"
     ]
     
-    def __init__(self, input_pdf_path: str):
+    # Only the first this many non-trivial lines of a page are checked for a
+    # header (None checks every line). Text extraction does not always emit a
+    # page's lines top to bottom, so this is off by default.
+    HEADER_SCAN_LINES = None
+    
+    # If set, pages whose content stream does not select a font at least this
+    # large near its start are assumed to carry no header and are not
+    # extracted. Many producers set a unit font size and scale text through
+    # the text matrix instead, so this is off by default. The probe reads raw
+    # content streams through PyPDF2, so enabling it parses the PDF with
+    # PyPDF2 even when pypdfium2 is installed.
+    HEADER_MIN_FONT_SIZE = None
+    
+    # Bytes of a page's content stream inspected for HEADER_MIN_FONT_SIZE
+    HEADER_PROBE_BYTES = 2048
+    
+    # With workers > 1, scans covering more pages than this extract text in
+    # worker processes; starting a pool costs about as much as extracting a
+    # few dozen pages in-process, with either backend
+    PARALLEL_MIN_PAGES = 64
+    
+    def __init__(self, input_pdf_path: str, cache_dir: str = None, workers: int = 1):
         """
         Initialize the PDF splitter.
         
         Args:
             input_pdf_path: Path to the input PDF file
+            cache_dir: Directory in which to persist extracted page text between
+                runs, keyed on the PDF's MD5 (optional)
+            workers: Number of worker processes used to extract text on long
+                scans; 1 (the default) extracts everything in this process
         """
         self.input_pdf_path = Path(input_pdf_path)
         if not self.input_pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {input_pdf_path}")
         
-        self.reader = PyPDF2.PdfReader(self.input_pdf_path)
-        self.num_pages = len(self.reader.pages)
+        # With pypdfium2, PDFium maps the file and resolves objects lazily in C,
+        # so PyPDF2's reader is only built if something asks for it
+        self._reader = None
+        if pdfium is not None:
+            self._document = pdfium.PdfDocument(self.input_pdf_path)
+            self.num_pages = len(self._document)
+            self._text_document = self._document
+        else:
+            self._document = None
+            self.num_pages = len(self.reader.pages)
+            self._text_document = self.reader
+        
+        self.workers = workers
+        
+        # Neither PyPDF2's reader nor PDFium may be used from several threads at once
+        self._document_lock = threading.Lock()
+        
+        # The qpdf command-line tool, if installed, is used to write the split files
+        self._qpdf = shutil.which('qpdf')
+        
+        # Lowercased component names, computed once rather than per line
+        self._components_lower = {c: c.lower() for c in self.COMPONENTS}
+        
+        # One matcher per component so difflib indexes each name only once
+        self._matchers = {
+            c: SequenceMatcher(None, b=c, autojunk=False) for c in self._components_lower.values()
+        }
+        self._component_counts = {c: Counter(c) for c in self._components_lower.values()}
+        self._similarity_cache: Dict[Tuple[str, str], float] = {}
+        self._header_patterns: Dict[str, Pattern] = {}  # compiled on first use
+        self._automaton = None
+        self._automaton_names = set()
+        
+        # Extracted text by page number, so each page is parsed at most once
+        self._text_cache: Dict[int, str] = {}
+        self._text_cache_file = None
+        self._text_cache_dirty = False
+        if cache_dir is not None:
+            # Backends extract different text, so each gets its own cache file
+            backend = 'pypdfium2' if pdfium is not None else 'pypdf2'
+            self._text_cache_file = Path(cache_dir).expanduser() / f"{self._file_md5()}-{backend}.json"
+            self._load_text_cache()
+    
+    @property
+    def reader(self) -> PyPDF2.PdfReader:
+        """PyPDF2 reader for the input PDF, created on first use."""
+        if self._reader is None:
+            self._reader = PyPDF2.PdfReader(self.input_pdf_path)
+        return self._reader
     
     def extract_text_from_page(self, page_num: int) -> str:
         """Extract text from a specific page."""
+        if page_num in self._text_cache:
+            return self._text_cache[page_num]
+        
         try:
-            return self.reader.pages[page_num].extract_text()
+            text = _page_text(self._text_document, page_num)
         except Exception as e:
+            # Not cached, so a later call (or run) tries the page again
             print(f"Warning: Could not extract text from page {page_num}: {e}")
             return ""
+        
+        self._text_cache[page_num] = text
+        self._text_cache_dirty = True
+        return text
+    
+    def iter_page_texts(self, start_page: int = 0,
+                        page_filter: Optional[Callable[[int], bool]] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (page_num, text) for each page from start_page, in page order.
+        
+        With more than one worker, long ranges are extracted in parallel by a
+        pool of worker processes, a bounded number of pages ahead of the
+        caller. Pages not yet extracted are cancelled if the caller stops
+        early, and if the pool breaks (e.g. a worker cannot start) the rest
+        are extracted in this process.
+        
+        Args:
+            start_page: Page to start from (0-indexed)
+            page_filter: Called with each page number just before the page is
+                extracted; pages for which it returns False are skipped
+        """
+        page_nums = range(start_page, self.num_pages)
+        missing = [page_num for page_num in page_nums if page_num not in self._text_cache]
+        if self.workers <= 1 or len(missing) <= self.PARALLEL_MIN_PAGES:
+            for page_num in page_nums:
+                if page_filter is None or page_filter(page_num):
+                    yield page_num, self.extract_text_from_page(page_num)
+            return
+        
+        path = str(self.input_pdf_path)
+        lookahead = 2 * self.workers
+        remaining_pages = iter(page_nums)
+        pending = deque()  # (page_num, future or None if cached), in page order
+        
+        def submit_next(executor) -> bool:
+            for page_num in remaining_pages:
+                if page_filter is not None and not page_filter(page_num):
+                    continue
+                # Queue the page before submitting so it is not lost if the pool is broken
+                pending.append((page_num, None))
+                if page_num not in self._text_cache:
+                    pending[-1] = (page_num, executor.submit(_extract_page_text, path, page_num))
+                return True
+            return False
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            try:
+                while len(pending) < lookahead and submit_next(executor):
+                    pass
+                while pending:
+                    page_num, future = pending[0]
+                    if future is not None:
+                        text = future.result()
+                        if text is not None:
+                            self._text_cache[page_num] = text
+                            self._text_cache_dirty = True
+                    pending.popleft()
+                    yield page_num, self._text_cache.get(page_num, "")
+                    while len(pending) < lookahead and submit_next(executor):
+                        pass
+            except BrokenProcessPool as e:
+                print(f"Warning: Text extraction workers failed ({e}); continuing in this process")
+            finally:
+                for _, future in pending:
+                    if future is not None:
+                        future.cancel()
+        
+        # Only reached with pages left if the pool broke
+        for page_num, _ in pending:
+            yield page_num, self.extract_text_from_page(page_num)
+        for page_num in remaining_pages:
+            if page_filter is None or page_filter(page_num):
+                yield page_num, self.extract_text_from_page(page_num)
+    
+    def _file_md5(self) -> str:
+        """Compute the MD5 of the input PDF."""
+        digest = hashlib.md5()
+        with open(self.input_pdf_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def _load_text_cache(self):
+        """Load previously extracted page text from the cache file, if any."""
+        if not self._text_cache_file.exists():
+            return
+        try:
+            with open(self._text_cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if not isinstance(cached, dict) or not all(isinstance(text, str) for text in cached.values()):
+                raise ValueError("expected an object mapping page numbers to text")
+            self._text_cache = {int(page): text for page, text in cached.items()}
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read text cache {self._text_cache_file}: {e}")
+    
+    def _save_text_cache(self):
+        """Write extracted page text to the cache file, if one is configured."""
+        if self._text_cache_file is None or not self._text_cache_dirty:
+            return
+        try:
+            self._text_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            
+            # Write to a temporary file and rename it into place, so an
+            # interrupted or concurrent run never leaves a truncated cache
+            fd, tmp_path = tempfile.mkstemp(dir=self._text_cache_file.parent,
+                                            prefix=self._text_cache_file.name, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(self._text_cache, f)
+                os.replace(tmp_path, self._text_cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self._text_cache_dirty = False
+        except OSError as e:
+            print(f"Warning: Could not write text cache {self._text_cache_file}: {e}")
     
     def find_section_boundaries(self, similarity_threshold: float = 0.7) -> Dict[str, int]:
         """
@@ -76,46 +426,322 @@ class PDFSplitter:
         """
         section_pages = {}
         
-        for page_num in range(start_page, self.num_pages):
-            text = self.extract_text_from_page(page_num)
-            text_lines = text.split('\n')
-            
-            # Check each line on the page for approximate component matches
-            for line in text_lines:
-                line_lower = line.lower().strip()
-                if not line_lower or len(line_lower) < 5:  # Skip empty lines or very short lines
+        page_filter = self._may_have_header if self.HEADER_MIN_FONT_SIZE is not None else None
+        # Close the iterator explicitly so the extraction pool shuts down as
+        # soon as the scan stops, including on early exit or an exception
+        with closing(self.iter_page_texts(start_page, page_filter)) as page_texts:
+            for page_num, text in page_texts:
+                # Skip empty lines or very short lines
+                lines = [line for line in text.splitlines() if len(line.strip()) >= 5]
+                if self.HEADER_SCAN_LINES is not None:
+                    lines = lines[:self.HEADER_SCAN_LINES]
+                remaining = [c for c in components if c not in section_pages]
+                if not lines or not remaining:
                     continue
                 
-                # Check each component name
-                for component in components:
-                    if component not in section_pages:
-                        # Use fuzzy matching
-                        similarity = self._calculate_similarity(
-                            line_lower, 
-                            component.lower()
-                        )
-                        
-                        if similarity >= similarity_threshold:
-                            section_pages[component] = page_num
-                            print(f"Found '{component}' on page {page_num + 1} "
-                                  f"(match: '{line[:60]}...' with score {similarity:.2f})")
-                            break  # Found a match for this line, move to next line
+                # Check each line on the page for approximate component matches
+                lines_lower = [' '.join(line.lower().split()) for line in lines]
+                for line_idx, component, similarity in self._match_lines(
+                        lines_lower, remaining, similarity_threshold):
+                    section_pages[component] = page_num
+                    print(f"Found '{component}' on page {page_num + 1} "
+                          f"(match: '{lines[line_idx][:60]}...' with score {similarity:.2f})")
+                
+                # Stop extracting pages once every component has been located
+                if len(section_pages) == len(components):
+                    break
         
+        self._save_text_cache()
         return section_pages
     
+    def _may_have_header(self, page_num: int) -> bool:
+        """
+        Cheaply check whether a page could start with a section header.
+        
+        Looks for a font selection (Tf operator) of at least
+        HEADER_MIN_FONT_SIZE near the start of the page's content stream.
+        Pages that cannot be inspected are assumed to qualify.
+        """
+        try:
+            contents = self.reader.pages[page_num].get_contents()
+            if contents is None:
+                return False
+            data = contents.get_data()[:self.HEADER_PROBE_BYTES]
+        except Exception:
+            return True
+        
+        return any(float(size) >= self.HEADER_MIN_FONT_SIZE
+                   for size in _FONT_SIZE_RE.findall(data))
+    
+    def _match_lines(self, lines_lower: List[str], components: List[str],
+                     similarity_threshold: float) -> List[Tuple[int, str, float]]:
+        """
+        Match lines against component names.
+        
+        Each line matches at most one component and each component is assigned
+        to the first line that matches it. Lines containing a component name
+        verbatim are matched first; fuzzy matching only runs for what is left.
+        
+        Args:
+            lines_lower: Lowercased, whitespace-normalised lines of text
+            components: Component names to search for
+            similarity_threshold: Minimum similarity score (0-1) to consider a match
+        
+        Returns:
+            List of tuples (line_index, component_name, similarity) in line order
+        """
+        components_lower = [self._lower_name(c) for c in components]
+        
+        # Score lines without numbering or page numbers around the header text
+        lines_lower = [self._header_text(line_lower) for line_lower in lines_lower]
+        matches = self._exact_matches(lines_lower, components_lower, similarity_threshold)
+        
+        if len(matches) < len(components):
+            matched_lines = {line_idx for line_idx, _, _ in matches}
+            found = {comp_idx for _, comp_idx, _ in matches}
+            rest_lines = [i for i in range(len(lines_lower)) if i not in matched_lines]
+            rest_comps = [i for i in range(len(components)) if i not in found]
+            fuzzy = self._fuzzy_matches(
+                [lines_lower[i] for i in rest_lines],
+                [components_lower[i] for i in rest_comps],
+                similarity_threshold
+            )
+            for line_idx, comp_idx, similarity in fuzzy:
+                matches.append((rest_lines[line_idx], rest_comps[comp_idx], similarity))
+            matches.sort()
+        
+        return [(line_idx, components[comp_idx], similarity)
+                for line_idx, comp_idx, similarity in matches]
+    
+    @staticmethod
+    def _header_text(line_lower: str) -> str:
+        """Strip section numbering and a trailing page number from a line."""
+        header = _HEADER_PAGE_RE.sub('', _HEADER_NUMBERING_RE.sub('', line_lower))
+        return header.rstrip(' .:-')
+    
+    def _exact_matches(self, lines_lower: List[str], components_lower: List[str],
+                       similarity_threshold: float) -> List[Tuple[int, int, float]]:
+        """
+        Find lines that contain a component name verbatim.
+        
+        The whole page is scanned at once: with pyahocorasick installed in a
+        single pass that also recognises names with one dropped or swapped
+        character, otherwise with a compiled regex per component.
+        A hit only counts when the line is short enough that fuzzy matching
+        would also accept it, so body text that mentions a section is not
+        mistaken for its header.
+        
+        Args:
+            lines_lower: Lowercased, whitespace-normalised lines of text
+            components_lower: Lowercased component names
+            similarity_threshold: Minimum similarity score (0-1) to consider a match
+        
+        Returns:
+            List of tuples (line_index, component_index, similarity) in line order
+        """
+        if ahocorasick is None:
+            hits = self._scan_patterns(lines_lower, components_lower)
+        else:
+            # Within a line, prefer verbatim names over single-edit variants
+            hits = sorted(self._scan_automaton(lines_lower, components_lower),
+                          key=lambda hit: (hit[0], not hit[2]))
+        
+        matches = []
+        found = set()
+        matched_lines = set()
+        for line_idx, comp_idx, exact in hits:
+            if comp_idx in found or line_idx in matched_lines:
+                continue
+            line_lower = lines_lower[line_idx]
+            line_len = len(line_lower)
+            comp_len = len(components_lower[comp_idx])
+            if 2.0 * comp_len / (line_len + comp_len) >= similarity_threshold:
+                if exact:
+                    similarity = 1.0
+                else:
+                    similarity = self._calculate_similarity(
+                        line_lower, components_lower[comp_idx], similarity_threshold)
+                    if similarity < similarity_threshold:
+                        continue
+                found.add(comp_idx)
+                matched_lines.add(line_idx)
+                matches.append((line_idx, comp_idx, similarity))
+        
+        return matches
+    
+    def _scan_automaton(self, lines_lower: List[str], components_lower: List[str]):
+        """Yield (line_index, component_index, exact) for each automaton hit, in text order."""
+        automaton = self._get_automaton(components_lower)
+        comp_indices = {c: i for i, c in enumerate(components_lower)}
+        line_starts = self._line_starts(lines_lower)
+        
+        for end_idx, (component_lower, exact) in automaton.iter('\n'.join(lines_lower)):
+            comp_idx = comp_indices.get(component_lower)
+            if comp_idx is not None:
+                yield bisect_right(line_starts, end_idx) - 1, comp_idx, exact
+    
+    def _scan_patterns(self, lines_lower: List[str], components_lower: List[str]) -> List[Tuple[int, int, bool]]:
+        """Return (line_index, component_index, exact) for each regex hit, in text order."""
+        text = '\n'.join(lines_lower)
+        line_starts = self._line_starts(lines_lower)
+        
+        hits = []
+        for comp_idx, component_lower in enumerate(components_lower):
+            pattern = self._header_patterns.get(component_lower)
+            if pattern is None:
+                pattern = self._compile_header_pattern(component_lower)
+                self._header_patterns[component_lower] = pattern
+            for match in pattern.finditer(text):
+                hits.append((match.start(), comp_idx))
+        
+        hits.sort()
+        return [(bisect_right(line_starts, start) - 1, comp_idx, True) for start, comp_idx in hits]
+    
+    @staticmethod
+    def _compile_header_pattern(component: str) -> Pattern:
+        """Compile a case-insensitive pattern for a component name that tolerates spacing changes."""
+        # Words may be separated by any run of whitespace on the same line
+        return re.compile(r'[^\S\n]+'.join(map(re.escape, component.split())), re.I)
+    
     @staticmethod
-    def _calculate_similarity(text1: str, text2: str) -> float:
+    def _line_starts(lines: List[str]) -> List[int]:
+        """Return the offset of each line within the newline-joined text."""
+        line_starts = []
+        offset = 0
+        for line in lines:
+            line_starts.append(offset)
+            offset += len(line) + 1
+        return line_starts
+    
+    def _get_automaton(self, components_lower: List[str]):
+        """Return an Aho-Corasick automaton covering the given component names."""
+        if self._automaton is None or not self._automaton_names.issuperset(components_lower):
+            self._automaton_names.update(components_lower)
+            automaton = ahocorasick.Automaton()
+            for component_lower in self._automaton_names:
+                for variant in self._single_edit_variants(component_lower):
+                    if variant not in automaton:
+                        automaton.add_word(variant, (component_lower, False))
+            # Verbatim names take precedence over variants of other names
+            for component_lower in self._automaton_names:
+                automaton.add_word(component_lower, (component_lower, True))
+            automaton.make_automaton()
+            self._automaton = automaton
+        return self._automaton
+    
+    @staticmethod
+    def _single_edit_variants(text: str) -> List[str]:
+        """Return variants of text with one character dropped or two adjacent ones swapped."""
+        variants = [text[:i] + text[i + 1:] for i in range(len(text))]
+        variants += [text[:i] + text[i + 1] + text[i] + text[i + 2:]
+                     for i in range(len(text) - 1) if text[i] != text[i + 1]]
+        return variants
+    
+    def _fuzzy_matches(self, lines_lower: List[str], components_lower: List[str],
+                       similarity_threshold: float) -> List[Tuple[int, int, float]]:
         """
-        Calculate similarity between two strings using SequenceMatcher.
+        Find lines that approximately match a component name.
         
         Args:
-            text1: First string
-            text2: Second string
+            lines_lower: Lowercased, stripped lines of text
+            components_lower: Lowercased component names
+            similarity_threshold: Minimum similarity score (0-1) to consider a match
+        
+        Returns:
+            List of tuples (line_index, component_index, similarity) in line order
+        """
+        matches = []
+        found = set()
+        if not lines_lower or not components_lower:
+            return matches
+        
+        if process is not None and np is not None:
+            # Score every (line, component) pair in one call to rapidfuzz. The
+            # cutoff lets it use bounded distance kernels and give up early on
+            # pairs that cannot reach it; those score 0. Scores are stored as
+            # uint8, which is enough for 0-100 and keeps the matrix small.
+            cutoff = similarity_threshold * 100
+            scores = process.cdist(lines_lower, components_lower, scorer=fuzz.ratio,
+                                   score_cutoff=cutoff, dtype=np.uint8)
+            
+            # The cutoff is applied before rounding, so any non-zero score is a hit
+            hits = scores > 0 if cutoff > 0 else np.ones(scores.shape, dtype=bool)
+            
+            # Earliest matching line per component (-1 for none)
+            first = np.where(hits.any(axis=0), hits.argmax(axis=0), -1)
+            matched = np.flatnonzero(first >= 0)
+            if len(np.unique(first[matched])) == len(matched):
+                # No line is claimed by two components, so that is the answer
+                for comp_idx in matched[np.argsort(first[matched], kind='stable')]:
+                    line_idx = first[comp_idx]
+                    matches.append((int(line_idx), int(comp_idx), float(scores[line_idx, comp_idx]) / 100.0))
+                return matches
+            
+            # Otherwise walk the lines with a hit in order, giving each line
+            # its best-scoring component that is still unmatched
+            for line_idx in np.flatnonzero(hits.any(axis=1)):
+                row = scores[line_idx]
+                for comp_idx in np.argsort(-row.astype(np.int16), kind='stable'):
+                    if not hits[line_idx, comp_idx]:
+                        break
+                    if comp_idx not in found:
+                        found.add(comp_idx)
+                        matches.append((int(line_idx), int(comp_idx), float(row[comp_idx]) / 100.0))
+                        break
+            return matches
+        
+        matchers = [self._get_matcher(c) for c in components_lower]
+        component_counts = [self._get_component_counts(c) for c in components_lower]
+        return _scan_lines(lines_lower, components_lower, matchers, component_counts,
+                           similarity_threshold, self._similarity_cache)
+    
+    def _calculate_similarity(self, line_lower: str, component_lower: str,
+                              score_cutoff: float = 0.0) -> float:
+        """
+        Calculate similarity between a line and a component name.
+        
+        Uses rapidfuzz when installed, otherwise a cached SequenceMatcher
+        for the component.
+        
+        Args:
+            line_lower: Lowercased, stripped line of text
+            component_lower: Lowercased component name
+            score_cutoff: Scores below this (0-1) may be reported as 0, which
+                lets rapidfuzz abandon hopeless comparisons early
         
         Returns:
             Similarity score from 0 to 1
         """
-        return SequenceMatcher(None, text1, text2).ratio()
+        if fuzz is not None:
+            cutoff = score_cutoff * 100
+            return fuzz.ratio(line_lower, component_lower, score_cutoff=cutoff) / 100.0
+        
+        return _cached_ratio(self._get_matcher(component_lower), line_lower,
+                             component_lower, self._similarity_cache)
+    
+    def _lower_name(self, component: str) -> str:
+        """Return the lowercased component name, computing it at most once."""
+        component_lower = self._components_lower.get(component)
+        if component_lower is None:
+            component_lower = component.lower()
+            self._components_lower[component] = component_lower
+        return component_lower
+    
+    def _get_component_counts(self, component_lower: str) -> Counter:
+        """Return the cached character counts of a component name."""
+        counts = self._component_counts.get(component_lower)
+        if counts is None:
+            counts = Counter(component_lower)
+            self._component_counts[component_lower] = counts
+        return counts
+    
+    def _get_matcher(self, component_lower: str) -> SequenceMatcher:
+        """Return the cached SequenceMatcher for a component, creating it if needed."""
+        matcher = self._matchers.get(component_lower)
+        if matcher is None:
+            matcher = SequenceMatcher(None, b=component_lower, autojunk=False)
+            self._matchers[component_lower] = matcher
+        return matcher
     
     def split_pdf(self, output_dir: str = None, similarity_threshold: float = 0.7) -> List[Tuple[str, Path]]:
         """
@@ -134,26 +760,17 @@ class PDFSplitter:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        # Handle fixed components first
-        results = []
+        # Collect (component_name, start_page, end_page) for every component
+        # before writing anything, so the files can be written concurrently
+        sections = []
         current_page = 0
         
         # 1. Overview/Summary - First page
-        results.append(self._extract_and_save_component(
-            "Project Summary",
-            0,
-            1,
-            output_path
-        ))
+        sections.append(("Project Summary", 0, 1))
         current_page = 1
         
         # 2. Description - Always 15 pages starting from page 2 (index 1)
-        results.append(self._extract_and_save_component(
-            "Project Description",
-            1,
-            16,  # Pages 2-16 (15 pages total)
-            output_path
-        ))
+        sections.append(("Project Description", 1, 16))  # Pages 2-16 (15 pages total)
         current_page = 16
         
         # 3. Find remaining sections using fuzzy matching (order not determined)
@@ -185,11 +802,14 @@ class PDFSplitter:
             else:
                 end_page = self.num_pages  # Last page of document
             
-            results.append(self._extract_and_save_component(
-                component_name,
-                start_page,
-                end_page,
-                output_path
+            sections.append((component_name, start_page, end_page))
+        
+        # Write the output files in parallel; results keep the order above
+        max_workers = min(len(sections), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(
+                lambda section: self._extract_and_save_component(*section, output_path),
+                sections
             ))
         
         return results
@@ -197,26 +817,78 @@ class PDFSplitter:
     def _extract_and_save_component(self, component_name: str, start_page: int, 
                                      end_page: int, output_path: Path) -> Tuple[str, Path]:
         """Extract pages and save as PDF file."""
-        writer = PyPDF2.PdfWriter()
-        
-        # Add pages from start_page to end_page (exclusive)
-        for page_num in range(start_page, min(end_page, self.num_pages)):
-            writer.add_page(self.reader.pages[page_num])
+        last_page = min(end_page, self.num_pages)
         
         # Generate output filename
         safe_name = self._sanitize_filename(component_name)
         output_file = output_path / f"{safe_name}.pdf"
         
-        # Write to file
-        with open(output_file, 'wb') as f:
-            writer.write(f)
+        written = False
+        if self._qpdf is not None and last_page > start_page:
+            # qpdf copies the page range in a separate process
+            written = self._save_with_qpdf(start_page, last_page, output_file)
+        
+        if not written:
+            # The source document is not thread-safe, so copying pages and
+            # serialising them is done under a lock; only the disk write overlaps
+            buffer = io.BytesIO()
+            with self._document_lock:
+                if self._document is not None:
+                    # Import pages from start_page to end_page (exclusive)
+                    dest = pdfium.PdfDocument.new()
+                    try:
+                        # An empty page list would make PDFium import every page
+                        if last_page > start_page:
+                            dest.import_pages(self._document, list(range(start_page, last_page)))
+                        dest.save(buffer)
+                    finally:
+                        dest.close()
+                else:
+                    writer = PyPDF2.PdfWriter()
+                    
+                    # Add pages from start_page to end_page (exclusive); add_page
+                    # already clones resources shared between pages only once
+                    for page_num in range(start_page, last_page):
+                        writer.add_page(self.reader.pages[page_num])
+                    
+                    writer.write(buffer)
+            
+            # Write to file
+            with open(output_file, 'wb') as f:
+                f.write(buffer.getbuffer())
         
-        num_pages = min(end_page, self.num_pages) - start_page
-        print(f"Created: {output_file} (pages {start_page + 1}-{min(end_page, self.num_pages)}, {num_pages} pages)")
+        num_pages = last_page - start_page
+        print(f"Created: {output_file} (pages {start_page + 1}-{last_page}, {num_pages} pages)")
         
         return (component_name, output_file)
     
+    def _save_with_qpdf(self, start_page: int, last_page: int, output_file: Path) -> bool:
+        """
+        Copy pages start_page..last_page-1 into output_file with the qpdf CLI.
+        
+        Returns:
+            True if qpdf wrote the file, False if the caller should fall back
+        """
+        # Page numbers are 1-indexed and inclusive for qpdf
+        command = [self._qpdf, '--empty', '--pages', str(self.input_pdf_path),
+                   f'{start_page + 1}-{last_page}', '--', str(output_file)]
+        try:
+            result = subprocess.run(command, stderr=subprocess.PIPE, universal_newlines=True)
+        except OSError as e:
+            print(f"Warning: Could not run qpdf for {output_file}: {e}")
+            return False
+        
+        # Exit status 3 means the file was written but qpdf issued warnings
+        # (common with damaged or repaired input)
+        if result.returncode in (0, 3):
+            return True
+        
+        print(f"Warning: qpdf failed for {output_file} (exit status {result.returncode}): "
+              f"{result.stderr.strip()}")
+        return False
+    
     @staticmethod
+    @lru_cache(maxsize=None)
     def _sanitize_filename(name: str) -> str:
         """Convert component name to safe filename."""
         # Replace spaces and special characters with underscores
@@ -225,7 +897,8 @@ class PDFSplitter:
         return safe_name.lower()
 
 
-def split_pdf(input_pdf: str, output_dir: str = None, similarity_threshold: float = 0.7) -> List[Tuple[str, Path]]:
+def split_pdf(input_pdf: str, output_dir: str = None, similarity_threshold: float = 0.7,
+              cache_dir: str = None, workers: int = 1) -> List[Tuple[str, Path]]:
     """
     Convenience function to split a PDF.
     
@@ -233,11 +906,13 @@ def split_pdf(input_pdf: str, output_dir: str = None, similarity_threshold: floa
         input_pdf: Path to input PDF
         output_dir: Directory for output PDFs (optional)
         similarity_threshold: Minimum similarity score (0-1) for fuzzy matching
+        cache_dir: Directory for persisting extracted page text between runs (optional)
+        workers: Worker processes for text extraction on long PDFs (default 1, in-process)
     
     Returns:
         List of tuples (component_name, output_file_path)
     """
-    splitter = PDFSplitter(input_pdf)
+    splitter = PDFSplitter(input_pdf, cache_dir, workers)
     return splitter.split_pdf(output_dir, similarity_threshold)
 
 
@@ -0,0 +1,52 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import PyPDF2
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import pdf_splitter  # noqa: E402
+from pdf_splitter import PDFSplitter  # noqa: E402
+
+
+class MatchLinesTest(unittest.TestCase):
+    """Header matching on already extracted, lowercased lines."""
+    
+    BODY_LINE = 'the data management plan will be shared'
+    
+    def setUp(self):
+        fd, self.pdf_path = tempfile.mkstemp(suffix='.pdf')
+        writer = PyPDF2.PdfWriter()
+        writer.add_blank_page(612, 792)
+        with os.fdopen(fd, 'wb') as f:
+            writer.write(f)
+        self.addCleanup(os.remove, self.pdf_path)
+    
+    def _check(self):
+        splitter = PDFSplitter(self.pdf_path)
+        
+        # A body sentence sharing most words with a component is not a header
+        self.assertEqual(
+            splitter._match_lines([self.BODY_LINE], ['Data Management and Sharing Plan'], 0.7), [])
+        
+        # Numbering and page numbers around a header do not stop it matching
+        lines_lower = [self.BODY_LINE, '1. mentoring plan page 3', '2.3 project summary ..... 12']
+        matches = splitter._match_lines(lines_lower, ['Project Summary', 'Mentoring Plan'], 0.7)
+        self.assertEqual([(line_idx, name) for line_idx, name, _ in matches],
+                         [(1, 'Mentoring Plan'), (2, 'Project Summary')])
+    
+    def test_match_lines(self):
+        self._check()
+    
+    def test_match_lines_difflib(self):
+        with mock.patch.object(pdf_splitter, 'fuzz', None), \
+                mock.patch.object(pdf_splitter, 'process', None), \
+                mock.patch.object(pdf_splitter, 'ahocorasick', None):
+            self._check()
+
+
+if __name__ == '__main__':
+    unittest.main()